@@ -1,13 +1,108 @@
 """AWS Bedrock Knowledge Base client for job openings retrieval."""
 
-import sys
-from typing import Any, Dict
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Optional, Tuple
 
 import boto3
+import msgspec
 from botocore.exceptions import BotoCoreError, ClientError
 
 from src.config import get_settings
-from src.models import JobOpeningResult, JobOpeningsResponse, SourceMetadata
+from src.models import (
+    JobOpeningResult,
+    JobOpeningsResponse,
+    S3Location,
+    SourceMetadata,
+    WebLocation,
+)
+
+logger = logging.getLogger("talent8.bedrock")
+
+
+class _RetrievedContent(msgspec.Struct):
+    """Content block of a Bedrock retrieve result."""
+
+    text: str = ""
+
+
+class _RetrievedLocation(msgspec.Struct, rename="camel"):
+    """Location block of a Bedrock retrieve result (camelCase on the wire)."""
+
+    type: str = "UNKNOWN"
+    s3_location: Optional[S3Location] = None
+    web_location: Optional[WebLocation] = None
+
+
+class _RetrievalResult(msgspec.Struct):
+    """Raw Bedrock retrieve result, decoded in a single msgspec.convert call."""
+
+    content: _RetrievedContent = msgspec.field(default_factory=_RetrievedContent)
+    score: Optional[Annotated[float, msgspec.Meta(ge=0.0, le=1.0)]] = None
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+    location: Optional[_RetrievedLocation] = None
+
+
+@lru_cache(maxsize=None)
+def _get_session() -> boto3.session.Session:
+    """
+    Get the shared boto3 session (module-level singleton).
+
+    Returns:
+        boto3.session.Session: Session reused across all Bedrock clients
+    """
+    return boto3.session.Session()
+
+
+@lru_cache(maxsize=None)
+def _make_client(config_items: Tuple[Tuple[str, Any], ...]):
+    """
+    Create a bedrock-agent-runtime client, cached per boto3 configuration.
+
+    Client construction loads service models and resolves endpoints and
+    credentials, so identical configurations share a single client.
+
+    Args:
+        config_items: Frozen items of the boto3 configuration dictionary
+
+    Returns:
+        A boto3 bedrock-agent-runtime client
+    """
+    return _get_session().client("bedrock-agent-runtime", **dict(config_items))
+
+
+def _normalize_query(query_text: str) -> str:
+    """
+    Normalize query text so equivalent queries share cache entries.
+
+    Args:
+        query_text: The raw search query
+
+    Returns:
+        str: Lowercased query with whitespace collapsed and trimmed
+    """
+    return " ".join(query_text.lower().split())
+
+
+@lru_cache(maxsize=128)
+def _retrieval_config(max_results: int) -> Dict[str, Any]:
+    """
+    Build the retrievalConfiguration for a given number of results.
+
+    max_results is bounded to 1-100 by JobOpeningQuery, so the cache stays
+    small and each request reuses a prebuilt dictionary. Callers must not
+    mutate the returned value.
+
+    Args:
+        max_results: Maximum number of results to return
+
+    Returns:
+        Dict[str, Any]: The retrievalConfiguration request parameter
+    """
+    return {"vectorSearchConfiguration": {"numberOfResults": max_results}}
 
 
 class BedrockClientError(Exception):
@@ -28,21 +123,33 @@ class BedrockClient:
         """Initialize the Bedrock client with configuration from settings."""
         self.settings = get_settings()
         self.knowledge_base_id = self.settings.bedrock_knowledge_base_id
+        self._cache: OrderedDict[Tuple, Tuple[float, JobOpeningsResponse]] = (
+            OrderedDict()
+        )
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
 
         try:
             boto3_config = self.settings.get_boto3_config()
-            self.client = boto3.client("bedrock-agent-runtime", **boto3_config)
-            self._log(f"Initialized Bedrock client for KB: {self.knowledge_base_id}")
+            self.client = _make_client(tuple(sorted(boto3_config.items())))
+            logger.info("Initialized Bedrock client for KB: %s", self.knowledge_base_id)
         except Exception as e:
-            self._log(f"Failed to initialize Bedrock client: {str(e)}", level="ERROR")
+            logger.error("Failed to initialize Bedrock client: %s", e)
             raise BedrockClientError(f"Failed to initialize Bedrock client: {str(e)}")
 
-    def retrieve_job_openings(
+    async def retrieve_job_openings(
         self, query_text: str, max_results: int = 10
     ) -> JobOpeningsResponse:
         """
         Retrieve job openings from the knowledge base using the retrieve API.
 
+        The blocking boto3 call runs in a worker thread so concurrent tool
+        calls overlap their network round-trips instead of blocking the
+        event loop. Recent responses are served from an in-memory LRU cache
+        until they are older than the configured TTL, and concurrent calls
+        for the same query share a single in-flight request. Unless disabled
+        in settings, the query is lowercased and its whitespace collapsed
+        before it is cached or sent.
+
         Args:
             query_text: The search query for job openings
             max_results: Maximum number of results to return (default: 10)
@@ -53,47 +160,159 @@ class BedrockClient:
         Raises:
             BedrockClientError: If the retrieval fails
         """
+        # Normalized text maximizes hits on both our cache and Bedrock's
+        request_text = query_text
+        if self.settings.normalize_queries:
+            request_text = _normalize_query(query_text)
+
+        cache_key = (self.knowledge_base_id, request_text, max_results)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.info("Cache hit for query: '%s'", query_text)
+            return cached
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            logger.info("Retrieving job openings for query: '%s'", query_text)
+            task = asyncio.ensure_future(
+                self._fetch_and_cache(cache_key, request_text, max_results)
+            )
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        else:
+            logger.info("Joining in-flight request for query: '%s'", query_text)
+
+        # Shield so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache(
+        self, cache_key: Tuple, query_text: str, max_results: int
+    ) -> JobOpeningsResponse:
+        """
+        Run the blocking retrieval in a worker thread and cache its response.
+
+        Args:
+            cache_key: Cache key built from knowledge base, query and max_results
+            query_text: The search query for job openings
+            max_results: Maximum number of results to return
+
+        Returns:
+            JobOpeningsResponse: Response containing job opening results
+        """
+        response = await asyncio.to_thread(
+            self._retrieve_job_openings, query_text, max_results
+        )
+        self._store_cached(cache_key, response)
+        return response
+
+    def warmup(self) -> None:
+        """
+        Pre-establish the HTTPS connection to Bedrock.
+
+        Issues a minimal retrieve (one result) so DNS resolution, the TLS
+        handshake and endpoint setup are done before the first real query.
+        Failures are logged and otherwise ignored.
+        """
         try:
-            self._log(f"Retrieving job openings for query: '{query_text}'")
+            self.client.retrieve(
+                knowledgeBaseId=self.knowledge_base_id,
+                retrievalQuery={"text": "warmup"},
+                retrievalConfiguration=_retrieval_config(1),
+            )
+            logger.info("Warmed up Bedrock connection")
+        except Exception as e:
+            logger.error("Bedrock warmup failed: %s", e)
+
+    def clear_cache(self) -> None:
+        """Drop all cached retrieval responses."""
+        self._cache.clear()
+
+    def _get_cached(self, key: Tuple) -> Optional[JobOpeningsResponse]:
+        """
+        Look up a cached response, discarding it if it has expired.
+
+        Args:
+            key: Cache key built from knowledge base, query and max_results
+
+        Returns:
+            Optional[JobOpeningsResponse]: The cached response, or None on miss
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
 
+        stored_at, response = entry
+        if time.monotonic() - stored_at >= self.settings.retrieval_cache_ttl:
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return response
+
+    def _store_cached(self, key: Tuple, response: JobOpeningsResponse) -> None:
+        """
+        Store a response in the cache, evicting the least recently used entry.
+
+        Args:
+            key: Cache key built from knowledge base, query and max_results
+            response: The response to cache
+        """
+        max_size = self.settings.retrieval_cache_size
+        if max_size <= 0:
+            return
+
+        self._cache[key] = (time.monotonic(), response)
+        self._cache.move_to_end(key)
+        while len(self._cache) > max_size:
+            self._cache.popitem(last=False)
+
+    def _retrieve_job_openings(
+        self, query_text: str, max_results: int
+    ) -> JobOpeningsResponse:
+        """
+        Synchronously retrieve job openings from the knowledge base.
+
+        Args:
+            query_text: The search query for job openings
+            max_results: Maximum number of results to return
+
+        Returns:
+            JobOpeningsResponse: Response containing job opening results
+
+        Raises:
+            BedrockClientError: If the retrieval fails
+        """
+        try:
             response = self.client.retrieve(
                 knowledgeBaseId=self.knowledge_base_id,
                 retrievalQuery={"text": query_text},
-                retrievalConfiguration={
-                    "vectorSearchConfiguration": {"numberOfResults": max_results}
-                },
+                retrievalConfiguration=_retrieval_config(max_results),
             )
 
             retrieval_results = response.get("retrievalResults", [])
-            self._log(f"Retrieved {len(retrieval_results)} results")
+            logger.info("Retrieved %d results", len(retrieval_results))
 
             # Parse results into our data models
-            job_results = [
-                self._parse_retrieve_result(result) for result in retrieval_results
-            ]
+            job_results = list(map(self._parse_retrieve_result, retrieval_results))
 
-            return JobOpeningsResponse(
-                results=job_results,
-                total_results=len(job_results),
-            )
+            return JobOpeningsResponse(results=job_results)
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             error_message = e.response.get("Error", {}).get("Message", str(e))
-            self._log(
-                f"AWS ClientError during retrieval: {error_code} - {error_message}",
-                level="ERROR",
+            logger.error(
+                "AWS ClientError during retrieval: %s - %s", error_code, error_message
             )
             raise BedrockClientError(
                 f"AWS error during retrieval: {error_code} - {error_message}"
             )
 
         except BotoCoreError as e:
-            self._log(f"BotoCoreError during retrieval: {str(e)}", level="ERROR")
+            logger.error("BotoCoreError during retrieval: %s", e)
             raise BedrockClientError(f"Failed to retrieve job openings: {str(e)}")
 
         except Exception as e:
-            self._log(f"Unexpected error during retrieval: {str(e)}", level="ERROR")
+            logger.error("Unexpected error during retrieval: %s", e)
             raise BedrockClientError(f"Unexpected error during retrieval: {str(e)}")
 
     def _parse_retrieve_result(self, result_data: Dict[str, Any]) -> JobOpeningResult:
@@ -106,55 +325,20 @@ class BedrockClient:
         Returns:
             JobOpeningResult: Parsed job opening result
         """
-        # Extract content (required field)
-        content_data = result_data.get("content", {})
-        content_text = content_data.get("text", "")
-
-        # Extract score (optional)
-        score = result_data.get("score")
+        raw = msgspec.convert(result_data, type=_RetrievalResult, strict=False)
 
-        # Extract metadata (optional)
-        metadata = result_data.get("metadata", {})
-
-        # Extract and parse location/source (optional)
         source = None
-        location_data = result_data.get("location")
-        if location_data:
-            source = self._parse_source_metadata(location_data)
+        location = raw.location
+        if location is not None:
+            source = SourceMetadata(
+                type=location.type,
+                s3_location=location.s3_location,
+                web_location=location.web_location,
+            )
 
         return JobOpeningResult(
-            content=content_text,
-            score=score,
-            metadata=metadata,
+            content=raw.content.text,
+            score=raw.score,
+            metadata=raw.metadata,
             source=source,
         )
-
-    def _parse_source_metadata(self, location_data: Dict[str, Any]) -> SourceMetadata:
-        """
-        Parse location data into SourceMetadata model.
-
-        Args:
-            location_data: Location data from Bedrock response
-
-        Returns:
-            SourceMetadata: Parsed source metadata
-        """
-        source_type = location_data.get("type", "UNKNOWN")
-        s3_location = location_data.get("s3Location")
-        web_location = location_data.get("webLocation")
-
-        return SourceMetadata(
-            type=source_type,
-            s3_location=s3_location,
-            web_location=web_location,
-        )
-
-    def _log(self, message: str, level: str = "INFO") -> None:
-        """
-        Log messages to stderr (required for MCP servers).
-
-        Args:
-            message: The message to log
-            level: Log level (INFO, ERROR, etc.)
-        """
-        print(f"[BedrockClient] [{level}] {message}", file=sys.stderr)
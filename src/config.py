@@ -1,10 +1,21 @@
 """Configuration management for Talent8 MCP Server."""
 
-from functools import lru_cache
+from functools import cache, cached_property
 from typing import Optional
 
+from botocore.config import Config
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Shared botocore configuration: pooled keep-alive connections, bounded
+# timeouts and adaptive retries for throttling bursts.
+BOTOCORE_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 3},
+    connect_timeout=3,
+    read_timeout=10,
+)
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -13,23 +24,36 @@ class Settings(BaseSettings):
     bedrock_knowledge_base_id: str
     aws_access_key_id: Optional[str] = None
     aws_secret_access_key: Optional[str] = None
+    retrieval_cache_size: int = 128
+    retrieval_cache_ttl: float = 60.0
+    normalize_queries: bool = True
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     def get_boto3_config(self) -> dict:
         """
         Get configuration dictionary for boto3 client initialization.
 
+        The dictionary is built once per (immutable) settings instance and
+        shared between callers, so it must not be mutated.
+
         Returns:
             dict: Configuration parameters for boto3 client.
-                  Includes credentials only if explicitly provided.
+                  Includes the shared botocore Config, and credentials
+                  only if explicitly provided.
         """
-        config = {"region_name": self.aws_region}
+        return self._boto3_config
+
+    @cached_property
+    def _boto3_config(self) -> dict:
+        """Build the boto3 configuration dictionary (cached per instance)."""
+        config = {"region_name": self.aws_region, "config": BOTOCORE_CONFIG}
 
         if self.aws_access_key_id and self.aws_secret_access_key:
             config["aws_access_key_id"] = self.aws_access_key_id
@@ -38,7 +62,7 @@ class Settings(BaseSettings):
         return config
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """
     Get cached settings instance (singleton pattern).
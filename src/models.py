@@ -1,8 +1,33 @@
 """Data models for Talent8 MCP Server."""
 
-from typing import Any, Dict, List, Optional
+import re
+from typing import Annotated, Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+import msgspec
+from pydantic import AfterValidator, BaseModel, Field, field_validator
+
+# Control characters other than tab and newline. A single character class is
+# matched in linear time by the stdlib re engine (no backtracking).
+_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+
+
+def _strip_control_chars(value: str) -> str:
+    """
+    Remove control characters from query text.
+
+    Args:
+        value: Raw query text
+
+    Returns:
+        str: Query text without control characters
+
+    Raises:
+        ValueError: If nothing printable remains
+    """
+    cleaned = _CONTROL_CHARS.sub("", value)
+    if not cleaned.strip():
+        raise ValueError("query text must contain printable characters")
+    return cleaned
 
 
 class JobOpeningQuery(BaseModel):
@@ -20,58 +45,101 @@ class JobOpeningQuery(BaseModel):
         description="Maximum number of results to return",
     )
 
+    @field_validator("query_text")
+    @classmethod
+    def validate_query_text(cls, v: str) -> str:
+        """Strip control characters and reject queries with no printable text."""
+        return _strip_control_chars(v)
 
-class SourceMetadata(BaseModel):
-    """Metadata about the source of a retrieved result."""
 
-    type: str = Field(..., description="Type of source (S3, WEB, etc.)")
-    s3_location: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="S3 location information if type is S3",
+class JobOpeningsBatchQuery(BaseModel):
+    """Query parameters for a batch of job opening searches."""
+
+    queries: List[
+        Annotated[str, Field(min_length=1), AfterValidator(_strip_control_chars)]
+    ] = Field(
+        ...,
+        min_length=1,
+        max_length=20,
+        description="Search query texts for job openings",
     )
-    web_location: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="Web location information if type is WEB",
+    max_results: int = Field(
+        default=10,
+        gt=0,
+        le=100,
+        description="Maximum number of results to return per query",
     )
 
 
-class JobOpeningResult(BaseModel):
+# Response-path models are msgspec Structs rather than Pydantic models:
+# they are built once per retrieved result, where Pydantic validation
+# dominates the parsing cost. Pydantic is kept for user input above.
+class S3Location(msgspec.Struct, frozen=True):
+    """Location of an S3-sourced document."""
+
+    uri: Annotated[
+        Optional[str], msgspec.Meta(description="S3 URI of the source document")
+    ] = None
+
+
+class WebLocation(msgspec.Struct, frozen=True):
+    """Location of a web-sourced document."""
+
+    url: Annotated[
+        Optional[str], msgspec.Meta(description="URL of the source web page")
+    ] = None
+
+
+class SourceMetadata(msgspec.Struct, frozen=True):
+    """Metadata about the source of a retrieved result."""
+
+    type: Annotated[str, msgspec.Meta(description="Type of source (S3, WEB, etc.)")]
+    s3_location: Annotated[
+        Optional[S3Location],
+        msgspec.Meta(description="S3 location information if type is S3"),
+    ] = None
+    web_location: Annotated[
+        Optional[WebLocation],
+        msgspec.Meta(description="Web location information if type is WEB"),
+    ] = None
+
+
+class JobOpeningResult(msgspec.Struct, frozen=True):
     """A single job opening result from the knowledge base."""
 
-    content: str = Field(..., description="The job opening content/description")
-    score: Optional[float] = Field(
-        default=None,
-        ge=0.0,
-        le=1.0,
-        description="Relevance score (0-1)",
-    )
-    metadata: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Additional metadata about the job opening",
-    )
-    source: Optional[SourceMetadata] = Field(
-        default=None,
-        description="Source information for the job opening",
-    )
+    content: Annotated[
+        str, msgspec.Meta(description="The job opening content/description")
+    ]
+    score: Annotated[
+        Optional[float],
+        msgspec.Meta(description="Relevance score (0-1)"),
+    ] = None
+    metadata: Annotated[
+        Dict[str, Any],
+        msgspec.Meta(description="Additional metadata about the job opening"),
+    ] = msgspec.field(default_factory=dict)
+    source: Annotated[
+        Optional[SourceMetadata],
+        msgspec.Meta(description="Source information for the job opening"),
+    ] = None
 
 
-class JobOpeningsResponse(BaseModel):
+class JobOpeningsResponse(msgspec.Struct, frozen=True):
     """Response containing multiple job opening results."""
 
-    results: List[JobOpeningResult] = Field(
-        default_factory=list,
-        description="List of job opening results",
-    )
-    total_results: int = Field(
-        default=0,
-        ge=0,
-        description="Total number of results returned",
-    )
+    results: Annotated[
+        List[JobOpeningResult],
+        msgspec.Meta(description="List of job opening results"),
+    ] = msgspec.field(default_factory=list)
+    total_results: Annotated[
+        int, msgspec.Meta(ge=0, description="Total number of results returned")
+    ] = 0
 
-    @field_validator("total_results")
-    @classmethod
-    def validate_total_results(cls, v: int, info) -> int:
-        """Ensure total_results matches the length of results list."""
-        if "results" in info.data:
-            return len(info.data["results"])
-        return v
+    def __post_init__(self) -> None:
+        """
+        Derive total_results from the results list.
+
+        This runs once per construction, after all fields are set, so callers
+        do not need to pass total_results; any value they pass is overwritten.
+        """
+        msgspec.structs.force_setattr(self, "total_results", len(self.results))
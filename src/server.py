@@ -1,16 +1,84 @@
 """Talent8 MCP Server for AWS Bedrock Knowledge Base job openings."""
 
+import asyncio
+import io
+import logging
+import os
 import sys
-from typing import Optional
+import threading
+from typing import Callable, Iterable, List, Optional
 
+import msgspec
 from mcp.server.fastmcp import FastMCP
+from pydantic import ValidationError
 
 from src.bedrock_client import BedrockClient, BedrockClientError
-from src.models import JobOpeningQuery
+from src.models import (
+    JobOpeningQuery,
+    JobOpeningResult,
+    JobOpeningsBatchQuery,
+    JobOpeningsResponse,
+)
+
+logger = logging.getLogger("talent8.server")
+
+
+def _resolve_log_level(name: str) -> int:
+    """
+    Map a TALENT8_LOG value to a logging level.
+
+    Args:
+        name: Level name, case-insensitive (e.g. "debug", "WARNING")
+
+    Returns:
+        int: The matching level, or logging.INFO (with a warning) if unknown
+    """
+    level = logging.getLevelName(name.upper())
+    if isinstance(level, int):
+        return level
+
+    logger.warning("Invalid TALENT8_LOG level '%s', using INFO", name)
+    return logging.INFO
+
+
+# Log to stderr (stdout is reserved for the MCP protocol). TALENT8_LOG sets
+# the level; disabled levels short-circuit before any message formatting.
+# Only the talent8 loggers are configured here so FastMCP's own logging
+# setup (and FASTMCP_LOG_LEVEL) still applies to the root logger.
+_log_handler = logging.StreamHandler(sys.stderr)
+_log_handler.setFormatter(logging.Formatter("[%(name)s] [%(levelname)s] %(message)s"))
+_talent8_logger = logging.getLogger("talent8")
+_talent8_logger.addHandler(_log_handler)
+_talent8_logger.propagate = False
+_talent8_logger.setLevel(_resolve_log_level(os.environ.get("TALENT8_LOG", "INFO")))
 
 # Initialize MCP server
 mcp = FastMCP("talent8-bedrock")
 
+# User-facing error messages
+_RETRIEVAL_FAILED = "Failed to retrieve job openings. Please try again later."
+_UNEXPECTED_ERROR = "An unexpected error occurred. Please try again later."
+_INVALID_INPUT = (
+    "Invalid request: queries must contain searchable text (at most 20 per "
+    "batch) and max_results must be between 1 and 100."
+)
+
+# Output templates for formatted job openings
+_BATCH_QUERY_TMPL = '=== Query {idx}: "{query}" ===\n'
+_NO_RESULTS = "No job openings found matching your query."
+_HEADER_TMPL = "Found {total} job opening(s):\n"
+_TITLE_TMPL = "\n\n--- Job Opening #{idx} ---"
+_SCORE_TMPL = "\nRelevance Score: {score:.1f}%"
+_CONTENT_TMPL = "\n\n{content}"
+_METADATA_HEADER = "\n\nMetadata:"
+_METADATA_ITEM_TMPL = "\n  - {key}: {value}"
+_SOURCE_TMPL = "\n\nSource Type: {type}"
+_S3_TMPL = "\nLocation: {uri}"
+_WEB_TMPL = "\nURL: {url}"
+
+# Reused JSON encoder for the JSON tool output
+_json_encoder = msgspec.json.Encoder()
+
 # Initialize Bedrock client (will be created once on first use)
 _bedrock_client: Optional[BedrockClient] = None
 
@@ -28,6 +96,22 @@ def get_bedrock_client() -> BedrockClient:
     return _bedrock_client
 
 
+def _start_eager_init() -> None:
+    """
+    Create the Bedrock client up front and warm its connection.
+
+    The warmup runs in a daemon thread so server startup is not delayed.
+    On failure the client is left to be created lazily on first use.
+    """
+    try:
+        client = get_bedrock_client()
+    except Exception as e:
+        logger.error("Eager Bedrock client initialization failed: %s", e)
+        return
+
+    threading.Thread(target=client.warmup, name="bedrock-warmup", daemon=True).start()
+
+
 @mcp.tool()
 async def get_job_openings(
     query_text: str,
@@ -47,89 +131,253 @@ async def get_job_openings(
     Returns:
         str: Formatted string containing job opening results with scores and metadata
     """
+    return await _query_job_openings(
+        query_text,
+        max_results,
+        lambda response: _format_job_openings_response(response.results),
+    )
+
+
+@mcp.tool()
+async def get_job_openings_json(
+    query_text: str,
+    max_results: int = 10,
+) -> str:
+    """
+    Retrieve job openings from AWS Bedrock Knowledge Base as JSON.
+
+    Same search as get_job_openings, but returns the results as a JSON
+    object for clients that process them programmatically.
+
+    Args:
+        query_text: Search query for job openings (e.g., "software engineer", "data scientist")
+        max_results: Maximum number of results to return (default: 10, max: 100)
+
+    Returns:
+        str: JSON object with "results" (content, score, metadata, source) and "total_results"
+    """
+    return await _query_job_openings(
+        query_text,
+        max_results,
+        lambda response: _format_job_openings_response_json(response).decode(),
+    )
+
+
+@mcp.tool()
+async def get_job_openings_batch(
+    queries: List[str],
+    max_results: int = 10,
+) -> str:
+    """
+    Retrieve job openings for several queries at once from AWS Bedrock Knowledge Base.
+
+    All queries are searched concurrently, so related searches cost roughly one
+    round-trip instead of one per query. Results are grouped under a header per query.
+
+    Args:
+        queries: Search queries for job openings (1-20, e.g., ["data engineer", "ML engineer"])
+        max_results: Maximum number of results to return per query (default: 10, max: 100)
+
+    Returns:
+        str: Formatted job opening results for each query, in the order given
+    """
+    try:
+        # Validate input using Pydantic model
+        batch = JobOpeningsBatchQuery(queries=queries, max_results=max_results)
+
+        logger.info(
+            "Processing batch of %d queries (max_results=%d)",
+            len(batch.queries),
+            batch.max_results,
+        )
+
+        # Get Bedrock client and retrieve results for all queries concurrently
+        client = get_bedrock_client()
+        responses = await asyncio.gather(
+            *(
+                client.retrieve_job_openings(
+                    query_text=query_text,
+                    max_results=batch.max_results,
+                )
+                for query_text in batch.queries
+            ),
+            return_exceptions=True,
+        )
+
+    except ValidationError as e:
+        return _invalid_input(e)
+
+    except Exception as e:
+        logger.error("Unexpected error: %s", e)
+        return _UNEXPECTED_ERROR
+
+    # Format each query's results, reporting failures per query
+    sections = []
+    for idx, (query_text, response) in enumerate(
+        zip(batch.queries, responses), start=1
+    ):
+        if isinstance(response, BedrockClientError):
+            logger.error("Error retrieving job openings: %s", response)
+            body = _RETRIEVAL_FAILED
+        elif isinstance(response, BaseException):
+            logger.error("Unexpected error: %s", response)
+            body = _UNEXPECTED_ERROR
+        else:
+            body = _format_job_openings_response(response.results)
+        sections.append(_BATCH_QUERY_TMPL.format(idx=idx, query=query_text) + body)
+
+    return "\n\n".join(sections)
+
+
+async def _query_job_openings(
+    query_text: str,
+    max_results: int,
+    formatter: Callable[[JobOpeningsResponse], str],
+) -> str:
+    """
+    Validate a query, retrieve matching job openings and format them.
+
+    Args:
+        query_text: Search query for job openings
+        max_results: Maximum number of results to return
+        formatter: Renders the retrieved response as the tool output
+
+    Returns:
+        str: Formatted job openings, or a user-facing error message
+    """
     try:
         # Validate input using Pydantic model
         query = JobOpeningQuery(query_text=query_text, max_results=max_results)
 
-        _log(f"Processing query: '{query.query_text}' (max_results={query.max_results})")
+        logger.info(
+            "Processing query: '%s' (max_results=%d)",
+            query.query_text,
+            query.max_results,
+        )
 
         # Get Bedrock client and retrieve results
         client = get_bedrock_client()
-        response = client.retrieve_job_openings(
+        response = await client.retrieve_job_openings(
             query_text=query.query_text,
             max_results=query.max_results,
         )
 
         # Format response for display
-        return _format_job_openings_response(response)
+        return formatter(response)
+
+    except ValidationError as e:
+        return _invalid_input(e)
 
     except BedrockClientError as e:
-        _log(f"Error retrieving job openings: {str(e)}", level="ERROR")
-        return "Failed to retrieve job openings. Please try again later."
+        logger.error("Error retrieving job openings: %s", e)
+        return _RETRIEVAL_FAILED
 
     except Exception as e:
-        _log(f"Unexpected error: {str(e)}", level="ERROR")
-        return "An unexpected error occurred. Please try again later."
+        logger.error("Unexpected error: %s", e)
+        return _UNEXPECTED_ERROR
+
 
+def _invalid_input(error: ValidationError) -> str:
+    """
+    Log rejected tool input and return the shared invalid-input message.
+
+    Args:
+        error: Validation error raised by the tool's Pydantic input model
+
+    Returns:
+        str: User-facing invalid-input message
+    """
+    logger.warning("Invalid request: %s", error)
+    return _INVALID_INPUT
 
-def _format_job_openings_response(response) -> str:
+
+def _format_job_openings_response_json(response: JobOpeningsResponse) -> bytes:
     """
-    Format job openings response into a human-readable string.
+    Encode a job openings response as JSON.
 
     Args:
         response: JobOpeningsResponse object
 
     Returns:
-        str: Formatted string with job opening details
+        bytes: UTF-8 encoded JSON document
     """
-    if response.total_results == 0:
-        return "No job openings found matching your query."
+    return _json_encoder.encode(response)
 
-    lines = [f"Found {response.total_results} job opening(s):\n"]
 
-    for idx, result in enumerate(response.results, start=1):
-        lines.append(f"\n--- Job Opening #{idx} ---")
+def _format_job_openings_response(results: Iterable[JobOpeningResult]) -> str:
+    """
+    Format job opening results into a human-readable string.
 
-        # Add relevance score if available
-        if result.score is not None:
-            score_pct = result.score * 100
-            lines.append(f"Relevance Score: {score_pct:.1f}%")
+    Results are consumed in a single pass, so any iterable (including a
+    generator) can be formatted; the header is prepended once the total
+    is known.
 
-        # Add content
-        lines.append(f"\n{result.content}")
+    Args:
+        results: Iterable of JobOpeningResult objects
 
-        # Add metadata if available
-        if result.metadata:
-            lines.append("\nMetadata:")
-            for key, value in result.metadata.items():
-                lines.append(f"  - {key}: {value}")
+    Returns:
+        str: Formatted string with job opening details
+    """
+    body = io.StringIO()
+    write = body.write
+    total = 0
 
-        # Add source information if available
-        if result.source:
-            lines.append(f"\nSource Type: {result.source.type}")
-            if result.source.s3_location:
-                uri = result.source.s3_location.get("uri", "N/A")
-                lines.append(f"Location: {uri}")
-            elif result.source.web_location:
-                url = result.source.web_location.get("url", "N/A")
-                lines.append(f"URL: {url}")
+    for idx, result in enumerate(results, start=1):
+        total = idx
+        write(_format_one(idx, result))
 
-        lines.append("")  # Empty line between results
+    if total == 0:
+        return _NO_RESULTS
 
-    return "\n".join(lines)
+    return _HEADER_TMPL.format(total=total) + body.getvalue()
 
 
-def _log(message: str, level: str = "INFO") -> None:
+def _format_one(idx: int, result: JobOpeningResult) -> str:
     """
-    Log messages to stderr (required for MCP servers).
+    Format a single job opening result block.
 
     Args:
-        message: The message to log
-        level: Log level (INFO, ERROR, etc.)
+        idx: 1-based position of the result
+        result: The JobOpeningResult to format
+
+    Returns:
+        str: Formatted block, including its leading blank line
     """
-    print(f"[MCP Server] [{level}] {message}", file=sys.stderr)
+    parts = [_TITLE_TMPL.format(idx=idx)]
+
+    # Add relevance score if available
+    if result.score is not None:
+        parts.append(_SCORE_TMPL.format(score=result.score * 100))
+
+    # Add content
+    parts.append(_CONTENT_TMPL.format(content=result.content))
+
+    # Add metadata if available
+    if result.metadata:
+        parts.append(_METADATA_HEADER)
+        parts.extend(
+            _METADATA_ITEM_TMPL.format(key=key, value=value)
+            for key, value in result.metadata.items()
+        )
+
+    # Add source information if available
+    source = result.source
+    if source:
+        parts.append(_SOURCE_TMPL.format(type=source.type))
+        if source.s3_location is not None:
+            parts.append(_S3_TMPL.format(uri=source.s3_location.uri or "N/A"))
+        elif source.web_location is not None:
+            parts.append(_WEB_TMPL.format(url=source.web_location.url or "N/A"))
+
+    parts.append("\n")  # Empty line between results
+    return "".join(parts)
+
+
+# Opt-in eager initialization so the first tool call skips client setup
+if os.environ.get("TALENT8_EAGER_INIT") == "1":
+    _start_eager_init()
 
 
 if __name__ == "__main__":
-    _log("Starting Talent8 MCP Server for AWS Bedrock")
+    logger.info("Starting Talent8 MCP Server for AWS Bedrock")
     mcp.run()
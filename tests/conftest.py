@@ -1,9 +1,32 @@
 """Pytest configuration and fixtures."""
 
+import logging
 import os
 import pytest
+import pytest_asyncio
 from typing import Generator
 
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests and fixtures on uvloop where it is available."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture
+def caplog(caplog):
+    """Also capture talent8 logs, which the server stops propagating to root."""
+    talent8_logger = logging.getLogger("talent8")
+    talent8_logger.addHandler(caplog.handler)
+    yield caplog
+    talent8_logger.removeHandler(caplog.handler)
+
 
 @pytest.fixture
 def mock_env_vars(monkeypatch) -> Generator[dict, None, None]:
@@ -37,3 +60,17 @@ def clean_env(monkeypatch) -> None:
 
     for key in env_keys:
         monkeypatch.delenv(key, raising=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_tools() -> list:
+    """Registered MCP tools, listed once per test session."""
+    from src.server import mcp
+
+    return await mcp.list_tools()
+
+
+@pytest.fixture(scope="session")
+def job_tool(mcp_tools):
+    """The registered get_job_openings tool definition."""
+    return next(t for t in mcp_tools if t.name == "get_job_openings")
@@ -8,7 +8,7 @@ from botocore.exceptions import ClientError, BotoCoreError
 @pytest.fixture
 def mock_bedrock_client():
     """Mock boto3 bedrock-agent-runtime client."""
-    with patch("src.bedrock_client.boto3.client") as mock_client:
+    with patch("src.bedrock_client._make_client") as mock_client:
         mock_instance = MagicMock()
         mock_client.return_value = mock_instance
         yield mock_instance
@@ -52,7 +52,24 @@ def test_bedrock_client_initialization(mock_env_vars, mock_bedrock_client):
     assert client.client is not None
 
 
-def test_retrieve_job_openings_success(
+def test_bedrock_client_reuses_cached_boto3_client(mock_env_vars):
+    """Test that clients with the same configuration share one boto3 client."""
+    from src.bedrock_client import BedrockClient, _make_client
+
+    _make_client.cache_clear()
+    try:
+        with patch("src.bedrock_client._get_session") as mock_session:
+            first = BedrockClient()
+            second = BedrockClient()
+
+        assert first.client is second.client
+        mock_session.return_value.client.assert_called_once()
+    finally:
+        _make_client.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_success(
     mock_env_vars, mock_bedrock_client, sample_retrieve_response
 ):
     """Test successful retrieval of job openings."""
@@ -61,7 +78,7 @@ def test_retrieve_job_openings_success(
     mock_bedrock_client.retrieve.return_value = sample_retrieve_response
 
     client = BedrockClient()
-    response = client.retrieve_job_openings("software engineer", max_results=10)
+    response = await client.retrieve_job_openings("software engineer", max_results=10)
 
     # Verify boto3 client was called correctly
     mock_bedrock_client.retrieve.assert_called_once()
@@ -77,7 +94,8 @@ def test_retrieve_job_openings_success(
     assert response.results[1].content == "Senior Data Scientist position"
 
 
-def test_retrieve_job_openings_empty_results(mock_env_vars, mock_bedrock_client):
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_empty_results(mock_env_vars, mock_bedrock_client):
     """Test retrieval with no results."""
     from src.bedrock_client import BedrockClient
 
@@ -87,13 +105,14 @@ def test_retrieve_job_openings_empty_results(mock_env_vars, mock_bedrock_client)
     }
 
     client = BedrockClient()
-    response = client.retrieve_job_openings("nonexistent position")
+    response = await client.retrieve_job_openings("nonexistent position")
 
     assert response.total_results == 0
     assert response.results == []
 
 
-def test_retrieve_job_openings_with_max_results(
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_with_max_results(
     mock_env_vars, mock_bedrock_client, sample_retrieve_response
 ):
     """Test retrieval with custom max_results."""
@@ -102,13 +121,14 @@ def test_retrieve_job_openings_with_max_results(
     mock_bedrock_client.retrieve.return_value = sample_retrieve_response
 
     client = BedrockClient()
-    client.retrieve_job_openings("engineer", max_results=5)
+    await client.retrieve_job_openings("engineer", max_results=5)
 
     call_kwargs = mock_bedrock_client.retrieve.call_args[1]
     assert call_kwargs["retrievalConfiguration"]["vectorSearchConfiguration"]["numberOfResults"] == 5
 
 
-def test_retrieve_job_openings_client_error(mock_env_vars, mock_bedrock_client):
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_client_error(mock_env_vars, mock_bedrock_client):
     """Test handling of AWS ClientError."""
     from src.bedrock_client import BedrockClient, BedrockClientError
 
@@ -120,12 +140,34 @@ def test_retrieve_job_openings_client_error(mock_env_vars, mock_bedrock_client):
     client = BedrockClient()
 
     with pytest.raises(BedrockClientError) as exc_info:
-        client.retrieve_job_openings("software engineer")
+        await client.retrieve_job_openings("software engineer")
 
     assert "ValidationException" in str(exc_info.value)
 
 
-def test_retrieve_job_openings_network_error(mock_env_vars, mock_bedrock_client):
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_logs_client_error(
+    mock_env_vars, mock_bedrock_client, caplog
+):
+    """Test that AWS errors are logged through the talent8.bedrock logger."""
+    from src.bedrock_client import BedrockClient, BedrockClientError
+
+    mock_bedrock_client.retrieve.side_effect = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Slow down"}},
+        "retrieve",
+    )
+
+    client = BedrockClient()
+
+    with caplog.at_level("ERROR", logger="talent8.bedrock"):
+        with pytest.raises(BedrockClientError):
+            await client.retrieve_job_openings("software engineer")
+
+    assert "ThrottlingException - Slow down" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_network_error(mock_env_vars, mock_bedrock_client):
     """Test handling of network errors."""
     from src.bedrock_client import BedrockClient, BedrockClientError
 
@@ -134,12 +176,13 @@ def test_retrieve_job_openings_network_error(mock_env_vars, mock_bedrock_client)
     client = BedrockClient()
 
     with pytest.raises(BedrockClientError) as exc_info:
-        client.retrieve_job_openings("software engineer")
+        await client.retrieve_job_openings("software engineer")
 
     assert "Failed to retrieve job openings" in str(exc_info.value)
 
 
-def test_retrieve_job_openings_handles_missing_fields(mock_env_vars, mock_bedrock_client):
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_handles_missing_fields(mock_env_vars, mock_bedrock_client):
     """Test handling of response with missing optional fields."""
     from src.bedrock_client import BedrockClient
 
@@ -155,7 +198,7 @@ def test_retrieve_job_openings_handles_missing_fields(mock_env_vars, mock_bedroc
     }
 
     client = BedrockClient()
-    response = client.retrieve_job_openings("engineer")
+    response = await client.retrieve_job_openings("engineer")
 
     assert response.total_results == 1
     assert response.results[0].content == "Minimal job posting"
@@ -164,6 +207,202 @@ def test_retrieve_job_openings_handles_missing_fields(mock_env_vars, mock_bedroc
     assert response.results[0].source is None
 
 
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_normalizes_query(
+    mock_env_vars, mock_bedrock_client, sample_retrieve_response, caplog
+):
+    """Test that query text is lowercased and whitespace-collapsed before sending."""
+    from src.bedrock_client import BedrockClient
+
+    mock_bedrock_client.retrieve.return_value = sample_retrieve_response
+
+    client = BedrockClient()
+    with caplog.at_level("INFO", logger="talent8.bedrock"):
+        await client.retrieve_job_openings("  Senior   Software\tENGINEER ")
+
+    call_kwargs = mock_bedrock_client.retrieve.call_args[1]
+    assert call_kwargs["retrievalQuery"]["text"] == "senior software engineer"
+    # Logs show what the user asked for, not the normalized request
+    assert "query: '  Senior   Software\tENGINEER '" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_normalization_opt_out(
+    mock_env_vars, mock_bedrock_client, sample_retrieve_response
+):
+    """Test that normalization can be disabled in settings."""
+    from src.bedrock_client import BedrockClient
+    from src.config import Settings
+
+    mock_bedrock_client.retrieve.return_value = sample_retrieve_response
+
+    client = BedrockClient()
+    client.settings = Settings(normalize_queries=False)
+    await client.retrieve_job_openings("Software Engineer")
+    await client.retrieve_job_openings("software engineer")
+
+    sent = [c[1]["retrievalQuery"]["text"] for c in mock_bedrock_client.retrieve.call_args_list]
+    assert sent == ["Software Engineer", "software engineer"]
+
+
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_caches_repeat_queries(
+    mock_env_vars, mock_bedrock_client, sample_retrieve_response
+):
+    """Test that repeat queries are served from the cache."""
+    from src.bedrock_client import BedrockClient
+
+    mock_bedrock_client.retrieve.return_value = sample_retrieve_response
+
+    client = BedrockClient()
+    first = await client.retrieve_job_openings("Software Engineer", max_results=5)
+    second = await client.retrieve_job_openings("  software engineer ", max_results=5)
+
+    assert second is first
+    mock_bedrock_client.retrieve.assert_called_once()
+
+    await client.retrieve_job_openings("software engineer", max_results=10)
+    assert mock_bedrock_client.retrieve.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_cache_expires(
+    mock_env_vars, mock_bedrock_client, sample_retrieve_response
+):
+    """Test that cached responses expire after the TTL."""
+    from src.bedrock_client import BedrockClient
+
+    mock_bedrock_client.retrieve.return_value = sample_retrieve_response
+
+    client = BedrockClient()
+    # Patch the module's time reference, not time.monotonic itself, so the
+    # event loop's clock keeps running
+    with patch("src.bedrock_client.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        await client.retrieve_job_openings("engineer")
+
+        mock_time.monotonic.return_value = 1000.0 + client.settings.retrieval_cache_ttl
+        await client.retrieve_job_openings("engineer")
+
+    assert mock_bedrock_client.retrieve.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_cache_evicts_least_recently_used(
+    mock_env_vars, mock_bedrock_client, sample_retrieve_response
+):
+    """Test that the cache evicts the least recently used entry when full."""
+    from src.bedrock_client import BedrockClient
+    from src.config import Settings
+
+    mock_bedrock_client.retrieve.return_value = sample_retrieve_response
+
+    client = BedrockClient()
+    client.settings = Settings(retrieval_cache_size=2)
+
+    await client.retrieve_job_openings("engineer")
+    await client.retrieve_job_openings("scientist")
+    await client.retrieve_job_openings("engineer")
+    await client.retrieve_job_openings("designer")
+    assert mock_bedrock_client.retrieve.call_count == 3
+
+    await client.retrieve_job_openings("engineer")
+    assert mock_bedrock_client.retrieve.call_count == 3
+
+    await client.retrieve_job_openings("scientist")
+    assert mock_bedrock_client.retrieve.call_count == 4
+
+    client.clear_cache()
+    await client.retrieve_job_openings("engineer")
+    assert mock_bedrock_client.retrieve.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_coalesces_concurrent_queries(
+    mock_env_vars, mock_bedrock_client, sample_retrieve_response
+):
+    """Test that concurrent identical queries share one Bedrock request."""
+    import asyncio
+
+    from src.bedrock_client import BedrockClient
+
+    mock_bedrock_client.retrieve.return_value = sample_retrieve_response
+
+    client = BedrockClient()
+    first, second = await asyncio.gather(
+        client.retrieve_job_openings("engineer"),
+        client.retrieve_job_openings("Engineer"),
+    )
+
+    assert first is second
+    mock_bedrock_client.retrieve.assert_called_once()
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_coalesced_error_reaches_all_callers(
+    mock_env_vars, mock_bedrock_client
+):
+    """Test that a failed shared request raises for every waiting caller."""
+    import asyncio
+
+    from src.bedrock_client import BedrockClient, BedrockClientError
+
+    mock_bedrock_client.retrieve.side_effect = BotoCoreError()
+
+    client = BedrockClient()
+    results = await asyncio.gather(
+        client.retrieve_job_openings("engineer"),
+        client.retrieve_job_openings("engineer"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, BedrockClientError) for r in results)
+    mock_bedrock_client.retrieve.assert_called_once()
+
+
+def test_warmup_issues_minimal_retrieve(mock_env_vars, mock_bedrock_client):
+    """Test that warmup sends a single-result retrieve."""
+    from src.bedrock_client import BedrockClient
+
+    client = BedrockClient()
+    client.warmup()
+
+    call_kwargs = mock_bedrock_client.retrieve.call_args[1]
+    assert call_kwargs["knowledgeBaseId"] == "test-kb-id-12345"
+    assert call_kwargs["retrievalConfiguration"]["vectorSearchConfiguration"]["numberOfResults"] == 1
+
+
+def test_warmup_ignores_errors(mock_env_vars, mock_bedrock_client):
+    """Test that warmup failures do not propagate."""
+    from src.bedrock_client import BedrockClient
+
+    mock_bedrock_client.retrieve.side_effect = BotoCoreError()
+
+    client = BedrockClient()
+    client.warmup()
+
+    mock_bedrock_client.retrieve.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_retrieve_job_openings_rejects_out_of_range_score(
+    mock_env_vars, mock_bedrock_client
+):
+    """Test that relevance scores outside 0-1 are rejected."""
+    from src.bedrock_client import BedrockClient, BedrockClientError
+
+    mock_bedrock_client.retrieve.return_value = {
+        "retrievalResults": [{"content": {"text": "Job posting"}, "score": 7.5}],
+        "ResponseMetadata": {"HTTPStatusCode": 200},
+    }
+
+    client = BedrockClient()
+
+    with pytest.raises(BedrockClientError):
+        await client.retrieve_job_openings("engineer")
+
+
 def test_parse_retrieve_result_with_complete_data(mock_env_vars):
     """Test parsing of complete retrieve result."""
     from src.bedrock_client import BedrockClient
@@ -185,4 +424,27 @@ def test_parse_retrieve_result_with_complete_data(mock_env_vars):
     assert result.score == 0.9
     assert result.metadata == {"key": "value"}
     assert result.source.type == "S3"
-    assert result.source.s3_location == {"uri": "s3://bucket/key"}
+    assert result.source.s3_location.uri == "s3://bucket/key"
+
+
+def test_parse_retrieve_result_with_web_location(mock_env_vars):
+    """Test parsing of a web-sourced result with extra Bedrock fields."""
+    from src.bedrock_client import BedrockClient
+
+    client = BedrockClient()
+    result_data = {
+        "content": {"type": "TEXT", "text": "Job description"},
+        "score": 1,
+        "location": {
+            "type": "WEB",
+            "webLocation": {"url": "https://example.com/job"},
+        },
+    }
+
+    result = client._parse_retrieve_result(result_data)
+
+    assert result.content == "Job description"
+    assert result.score == 1.0
+    assert result.source.type == "WEB"
+    assert result.source.web_location.url == "https://example.com/job"
+    assert result.source.s3_location is None
@@ -67,6 +67,21 @@ def test_config_get_boto3_config(mock_env_vars):
     assert boto3_config["aws_secret_access_key"] == "test-secret-key"
 
 
+def test_config_get_boto3_config_includes_botocore_config(mock_env_vars):
+    """Test that get_boto3_config tunes pooling, keepalive and retries."""
+    from botocore.config import Config
+
+    from src.config import Settings
+
+    boto3_config = Settings().get_boto3_config()
+    botocore_config = boto3_config["config"]
+
+    assert isinstance(botocore_config, Config)
+    assert botocore_config.max_pool_connections == 50
+    assert botocore_config.tcp_keepalive is True
+    assert botocore_config.retries["mode"] == "adaptive"
+
+
 def test_config_get_boto3_config_without_credentials(monkeypatch, clean_env):
     """Test that get_boto3_config works without explicit credentials (IAM roles)."""
     from src.config import Settings
@@ -90,3 +105,22 @@ def test_config_singleton_pattern(mock_env_vars):
     settings2 = get_settings()
 
     assert settings1 is settings2
+
+
+def test_config_get_boto3_config_is_cached(mock_env_vars):
+    """Test that get_boto3_config builds its dictionary only once."""
+    from src.config import Settings
+
+    settings = Settings()
+
+    assert settings.get_boto3_config() is settings.get_boto3_config()
+
+
+def test_config_is_immutable(mock_env_vars):
+    """Test that settings cannot be modified after loading."""
+    from src.config import Settings
+
+    settings = Settings()
+
+    with pytest.raises(ValidationError):
+        settings.aws_region = "eu-west-1"
@@ -42,6 +42,29 @@ def test_job_opening_query_empty_text_fails():
         JobOpeningQuery(query_text="")
 
 
+def test_job_opening_query_strips_control_chars():
+    """Test that control characters are removed from query_text."""
+    from src.models import JobOpeningQuery
+
+    query = JobOpeningQuery(query_text="data\x00 sci\x1bentist\tremote")
+
+    assert query.query_text == "data scientist\tremote"
+
+
+def test_job_opening_query_rejects_unprintable_text():
+    """Test that queries without printable characters are rejected."""
+    from src.models import JobOpeningQuery, JobOpeningsBatchQuery
+
+    with pytest.raises(ValidationError):
+        JobOpeningQuery(query_text="\x00\x07")
+
+    with pytest.raises(ValidationError):
+        JobOpeningQuery(query_text="   ")
+
+    with pytest.raises(ValidationError):
+        JobOpeningsBatchQuery(queries=["engineer", "\x1b"])
+
+
 def test_job_opening_query_max_results_positive():
     """Test that max_results must be positive."""
     from src.models import JobOpeningQuery
@@ -53,37 +76,61 @@ def test_job_opening_query_max_results_positive():
         JobOpeningQuery(query_text="engineer", max_results=-1)
 
 
+def test_job_openings_batch_query_valid():
+    """Test JobOpeningsBatchQuery model with valid data."""
+    from src.models import JobOpeningsBatchQuery
+
+    batch = JobOpeningsBatchQuery(queries=["data engineer", "ML engineer"])
+
+    assert batch.queries == ["data engineer", "ML engineer"]
+    assert batch.max_results == 10  # Default value
+
+
+def test_job_openings_batch_query_rejects_invalid_queries():
+    """Test that JobOpeningsBatchQuery rejects empty and oversized batches."""
+    from src.models import JobOpeningsBatchQuery
+
+    with pytest.raises(ValidationError):
+        JobOpeningsBatchQuery(queries=[])
+
+    with pytest.raises(ValidationError):
+        JobOpeningsBatchQuery(queries=["engineer", ""])
+
+    with pytest.raises(ValidationError):
+        JobOpeningsBatchQuery(queries=["engineer"] * 21)
+
+
 def test_source_metadata_valid():
     """Test SourceMetadata model with valid data."""
-    from src.models import SourceMetadata
+    from src.models import S3Location, SourceMetadata
 
     metadata = SourceMetadata(
         type="S3",
-        s3_location={"uri": "s3://bucket/key.pdf"},
+        s3_location=S3Location(uri="s3://bucket/key.pdf"),
     )
 
     assert metadata.type == "S3"
-    assert metadata.s3_location == {"uri": "s3://bucket/key.pdf"}
+    assert metadata.s3_location.uri == "s3://bucket/key.pdf"
     assert metadata.web_location is None
 
 
 def test_source_metadata_web_location():
     """Test SourceMetadata with web location."""
-    from src.models import SourceMetadata
+    from src.models import SourceMetadata, WebLocation
 
     metadata = SourceMetadata(
         type="WEB",
-        web_location={"url": "https://example.com/job"},
+        web_location=WebLocation(url="https://example.com/job"),
     )
 
     assert metadata.type == "WEB"
-    assert metadata.web_location == {"url": "https://example.com/job"}
+    assert metadata.web_location.url == "https://example.com/job"
     assert metadata.s3_location is None
 
 
 def test_job_opening_result_valid():
     """Test JobOpeningResult model with valid data."""
-    from src.models import JobOpeningResult, SourceMetadata
+    from src.models import JobOpeningResult, S3Location, SourceMetadata
 
     result = JobOpeningResult(
         content="Software Engineer - Remote position available",
@@ -91,7 +138,7 @@ def test_job_opening_result_valid():
         metadata={"job_id": "12345", "department": "Engineering"},
         source=SourceMetadata(
             type="S3",
-            s3_location={"uri": "s3://jobs/position.pdf"},
+            s3_location=S3Location(uri="s3://jobs/position.pdf"),
         ),
     )
 
@@ -132,6 +179,32 @@ def test_job_openings_response_valid():
     assert response.results[0].content == "Job 1"
 
 
+def test_job_openings_response_derives_total_results():
+    """Test that total_results always matches the number of results."""
+    from src.models import JobOpeningResult, JobOpeningsResponse
+
+    response = JobOpeningsResponse(
+        results=[JobOpeningResult(content="Job 1"), JobOpeningResult(content="Job 2")],
+        total_results=5,
+    )
+
+    assert response.total_results == 2
+
+
+def test_job_opening_result_is_immutable():
+    """Test that response-path results are frozen."""
+    from src.models import JobOpeningResult, JobOpeningsResponse
+
+    result = JobOpeningResult(content="Job description")
+    response = JobOpeningsResponse(results=[result])
+
+    with pytest.raises(AttributeError):
+        result.content = "Changed"
+
+    with pytest.raises(AttributeError):
+        response.total_results = 5
+
+
 def test_job_openings_response_empty():
     """Test JobOpeningsResponse with no results."""
     from src.models import JobOpeningsResponse
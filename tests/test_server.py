@@ -1,81 +1,117 @@
 """Tests for MCP server."""
 
+import json
+import logging
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from src.models import JobOpeningResult, JobOpeningsResponse
+import pytest_asyncio
+from unittest.mock import patch
+
+import src.server
+from src.bedrock_client import BedrockClientError
+from src.models import (
+    JobOpeningResult,
+    JobOpeningsResponse,
+    S3Location,
+    SourceMetadata,
+    WebLocation,
+)
+from src.server import (
+    _format_job_openings_response,
+    _resolve_log_level,
+    _start_eager_init,
+    get_job_openings,
+    get_job_openings_batch,
+    get_job_openings_json,
+    mcp,
+)
+
+# Keep server tests on one xdist worker so they share the session event loop
+# and the module-scoped fixtures (effective with --dist loadgroup).
+pytestmark = pytest.mark.xdist_group("server")
+
+# Sample responses (frozen Structs, so safe to share across tests)
+SAMPLE_JOB_RESULTS = JobOpeningsResponse(
+    results=[
+        JobOpeningResult(
+            content="Software Engineer - Remote position",
+            score=0.95,
+            metadata={"job_id": "12345"},
+        ),
+        JobOpeningResult(
+            content="Senior Data Scientist role",
+            score=0.87,
+            metadata={"job_id": "67890"},
+        ),
+    ],
+    total_results=2,
+)
+EMPTY_JOB_RESULTS = JobOpeningsResponse(results=[], total_results=0)
+
+
+class _StubBedrockClient:
+    """Minimal BedrockClient stand-in that records retrieve calls."""
+
+    def __init__(self, result=None):
+        # A response or exception, or a list of them consumed one per call
+        self.result = result
+        self.calls = []
+
+    @property
+    def last_call(self) -> dict:
+        """Keyword arguments of the most recent retrieve call."""
+        return self.calls[-1]
+
+    async def retrieve_job_openings(self, **kwargs):
+        """Record the call and return (or raise) the configured result."""
+        self.calls.append(kwargs)
+        result = self.result.pop(0) if isinstance(self.result, list) else self.result
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def warmup(self) -> None:
+        """No-op stand-in for the connection warmup."""
 
 
 @pytest.fixture
-def reset_bedrock_client():
-    """Reset the global bedrock client before each test."""
-    import src.server
-    src.server._bedrock_client = None
-    yield
-    src.server._bedrock_client = None
+def mock_bedrock_client(monkeypatch):
+    """Replace BedrockClient with a stub and reset the global client."""
+    stub = _StubBedrockClient()
+    monkeypatch.setattr(src.server, "BedrockClient", lambda: stub)
+    monkeypatch.setattr(src.server, "_bedrock_client", None)
+    return stub
 
 
-@pytest.fixture
-def mock_bedrock_client():
-    """Mock BedrockClient class."""
-    with patch("src.server.BedrockClient") as mock_class:
-        mock_instance = MagicMock()
-        mock_class.return_value = mock_instance
-        yield mock_instance
+@pytest_asyncio.fixture(scope="module")
+async def job_openings_call():
+    """Call get_job_openings once against a mocked client; share the outcome."""
+    stub = _StubBedrockClient(result=SAMPLE_JOB_RESULTS)
 
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(src.server, "BedrockClient", lambda: stub)
+        mp.setattr(src.server, "_bedrock_client", None)
+        result = await get_job_openings(query_text="software engineer")
 
-@pytest.fixture
-def sample_job_results():
-    """Sample job opening results."""
-    return JobOpeningsResponse(
-        results=[
-            JobOpeningResult(
-                content="Software Engineer - Remote position",
-                score=0.95,
-                metadata={"job_id": "12345"},
-            ),
-            JobOpeningResult(
-                content="Senior Data Scientist role",
-                score=0.87,
-                metadata={"job_id": "67890"},
-            ),
-        ],
-        total_results=2,
-    )
+    return stub, result
 
 
-@pytest.mark.asyncio
-async def test_get_job_openings_tool_exists(mock_env_vars):
+def test_get_job_openings_tool_exists(mcp_tools):
     """Test that get_job_openings tool is registered."""
-    from src.server import mcp
-
-    # Get list of tools (async in FastMCP, returns list directly)
-    tools = await mcp.list_tools()
-    tool_names = [tool.name for tool in tools]
+    tool_names = [tool.name for tool in mcp_tools]
 
     assert "get_job_openings" in tool_names
 
 
-@pytest.mark.asyncio
-async def test_get_job_openings_tool_has_description(mock_env_vars):
+def test_get_job_openings_tool_has_description(job_tool):
     """Test that get_job_openings tool has proper description."""
-    from src.server import mcp
-
-    tools = await mcp.list_tools()
-    job_tool = next(t for t in tools if t.name == "get_job_openings")
-
     assert job_tool.description is not None
     assert len(job_tool.description) > 0
     assert "job" in job_tool.description.lower()
 
 
-@pytest.mark.asyncio
-async def test_get_job_openings_tool_schema(mock_env_vars):
+def test_get_job_openings_tool_schema(job_tool):
     """Test that get_job_openings tool has correct input schema."""
-    from src.server import mcp
-
-    tools = await mcp.list_tools()
-    job_tool = next(t for t in tools if t.name == "get_job_openings")
-
     # Check input schema has required fields
     schema = job_tool.inputSchema
     assert "properties" in schema
@@ -83,109 +119,214 @@ async def test_get_job_openings_tool_schema(mock_env_vars):
     assert schema["properties"]["query_text"]["type"] == "string"
 
 
-@pytest.mark.asyncio
-async def test_get_job_openings_success(
-    mock_env_vars, reset_bedrock_client, mock_bedrock_client, sample_job_results
-):
-    """Test successful job openings retrieval."""
-    from src.server import get_job_openings
+def test_get_job_openings_success(job_openings_call):
+    """Test that job openings retrieval calls the client with defaults."""
+    stub, _ = job_openings_call
 
-    mock_bedrock_client.retrieve_job_openings.return_value = sample_job_results
+    # Verify bedrock client was called once with the defaults
+    assert stub.calls == [{"query_text": "software engineer", "max_results": 10}]
 
-    result = await get_job_openings(query_text="software engineer")
 
-    # Verify bedrock client was called
-    mock_bedrock_client.retrieve_job_openings.assert_called_once()
-    call_args = mock_bedrock_client.retrieve_job_openings.call_args
-    assert call_args.kwargs["query_text"] == "software engineer"
-    assert call_args.kwargs["max_results"] == 10
+@pytest.mark.parametrize(
+    "needle",
+    [
+        "Found 2 job opening",
+        "Software Engineer - Remote position",
+        "Senior Data Scientist role",
+        "95.0%",  # relevance scores
+        "87.0%",
+        "12345",  # job IDs from metadata
+        "67890",
+    ],
+)
+def test_get_job_openings_output_includes(job_openings_call, needle):
+    """Test that formatted output includes content, scores and metadata."""
+    _, result = job_openings_call
 
-    # Verify result format
-    assert "Found 2 job opening" in result
-    assert "Software Engineer - Remote position" in result
-    assert "Senior Data Scientist role" in result
+    assert needle in result
 
 
 @pytest.mark.asyncio
 async def test_get_job_openings_with_custom_max_results(
-    mock_env_vars, reset_bedrock_client, mock_bedrock_client, sample_job_results
+    mock_env_vars, mock_bedrock_client
 ):
     """Test job openings retrieval with custom max_results."""
-    from src.server import get_job_openings
+    mock_bedrock_client.result = SAMPLE_JOB_RESULTS
 
-    mock_bedrock_client.retrieve_job_openings.return_value = sample_job_results
+    await get_job_openings(query_text="engineer", max_results=5)
 
-    result = await get_job_openings(query_text="engineer", max_results=5)
-
-    call_args = mock_bedrock_client.retrieve_job_openings.call_args
-    assert call_args.kwargs["max_results"] == 5
+    assert mock_bedrock_client.last_call["max_results"] == 5
 
 
 @pytest.mark.asyncio
-async def test_get_job_openings_no_results(mock_env_vars, reset_bedrock_client, mock_bedrock_client):
-    """Test job openings retrieval with no results."""
-    from src.server import get_job_openings
+@pytest.mark.parametrize(
+    "result, needle",
+    [
+        (SAMPLE_JOB_RESULTS, "Found 2 job opening"),
+        (EMPTY_JOB_RESULTS, "No job openings found"),
+        (BedrockClientError("Test error"), "Failed to retrieve job openings"),
+    ],
+    ids=["results", "no-results", "client-error"],
+)
+async def test_get_job_openings_outcomes(
+    mock_env_vars, mock_bedrock_client, result, needle
+):
+    """Test formatted output for results, no results and client errors."""
+    mock_bedrock_client.result = result
 
-    empty_response = JobOpeningsResponse(results=[], total_results=0)
-    mock_bedrock_client.retrieve_job_openings.return_value = empty_response
+    output = await get_job_openings(query_text="engineer")
 
-    result = await get_job_openings(query_text="nonexistent position")
+    assert needle in output
 
-    assert "No job openings found" in result
 
 
 @pytest.mark.asyncio
-async def test_get_job_openings_handles_errors(
-    mock_env_vars, reset_bedrock_client, mock_bedrock_client
+@pytest.mark.parametrize(
+    "tool", [get_job_openings, get_job_openings_json], ids=["text", "json"]
+)
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"query_text": "   "}, {"query_text": "engineer", "max_results": 0}],
+    ids=["blank-query", "zero-max-results"],
+)
+async def test_get_job_openings_rejects_invalid_input(
+    mock_env_vars, mock_bedrock_client, tool, kwargs
 ):
-    """Test job openings retrieval handles errors gracefully."""
-    from src.server import get_job_openings
-    from src.bedrock_client import BedrockClientError
+    """Test that invalid input is reported without calling Bedrock."""
+    result = await tool(**kwargs)
 
-    mock_bedrock_client.retrieve_job_openings.side_effect = BedrockClientError(
-        "Test error"
-    )
+    assert result == src.server._INVALID_INPUT
+    assert mock_bedrock_client.calls == []
 
-    result = await get_job_openings(query_text="engineer")
+def test_get_job_openings_json_tool_exists(mcp_tools):
+    """Test that get_job_openings_json tool is registered."""
+    tool_names = [tool.name for tool in mcp_tools]
 
-    assert "failed" in result.lower()
+    assert "get_job_openings_json" in tool_names
 
 
 @pytest.mark.asyncio
-async def test_get_job_openings_includes_scores(
-    mock_env_vars, reset_bedrock_client, mock_bedrock_client, sample_job_results
+async def test_get_job_openings_json_success(
+    mock_env_vars, mock_bedrock_client
 ):
-    """Test that results include relevance scores when available."""
-    from src.server import get_job_openings
+    """Test that the JSON tool returns the encoded response."""
+    mock_bedrock_client.result = SAMPLE_JOB_RESULTS
+
+    result = await get_job_openings_json(query_text="engineer", max_results=5)
+    payload = json.loads(result)
+
+    assert mock_bedrock_client.last_call["max_results"] == 5
+    assert payload["total_results"] == 2
+    assert payload["results"][0]["content"] == "Software Engineer - Remote position"
+    assert payload["results"][0]["score"] == 0.95
+    assert payload["results"][1]["metadata"] == {"job_id": "67890"}
 
-    mock_bedrock_client.retrieve_job_openings.return_value = sample_job_results
 
-    result = await get_job_openings(query_text="engineer")
+@pytest.mark.asyncio
+async def test_get_job_openings_batch_success(
+    mock_env_vars, mock_bedrock_client
+):
+    """Test batch retrieval formats each query and reports failures per query."""
+    mock_bedrock_client.result = [
+        SAMPLE_JOB_RESULTS,
+        BedrockClientError("Test error"),
+    ]
+
+    result = await get_job_openings_batch(
+        queries=["software engineer", "data scientist"], max_results=3
+    )
 
-    # Check that scores are included in formatted output (95.0%)
-    assert "95.0%" in result
-    assert "87.0%" in result
+    assert mock_bedrock_client.calls == [
+        {"query_text": "software engineer", "max_results": 3},
+        {"query_text": "data scientist", "max_results": 3},
+    ]
+
+    first, second = result.split('=== Query 2: "data scientist" ===')
+    assert first.startswith('=== Query 1: "software engineer" ===')
+    assert "Found 2 job opening" in first
+    assert "failed" in second.lower()
 
 
 @pytest.mark.asyncio
-async def test_get_job_openings_includes_metadata(
-    mock_env_vars, reset_bedrock_client, mock_bedrock_client, sample_job_results
+async def test_get_job_openings_batch_rejects_empty_batch(
+    mock_env_vars, mock_bedrock_client
+):
+    """Test that an empty batch is rejected without calling Bedrock."""
+    result = await get_job_openings_batch(queries=[])
+
+    assert result == src.server._INVALID_INPUT
+    assert mock_bedrock_client.calls == []
+
+
+def test_start_eager_init_warms_client_in_background(
+    mock_env_vars, mock_bedrock_client
 ):
-    """Test that results include metadata when available."""
-    from src.server import get_job_openings
+    """Test that eager initialization creates the client and runs warmup."""
+    with patch("src.server.threading.Thread") as mock_thread:
+        _start_eager_init()
+
+    assert src.server._bedrock_client is mock_bedrock_client
+    mock_thread.assert_called_once()
+    assert mock_thread.call_args.kwargs["target"] == mock_bedrock_client.warmup
+    assert mock_thread.call_args.kwargs["daemon"] is True
+    mock_thread.return_value.start.assert_called_once()
 
-    mock_bedrock_client.retrieve_job_openings.return_value = sample_job_results
 
-    result = await get_job_openings(query_text="engineer")
+def test_format_job_openings_response_accepts_generator():
+    """Test that results can be formatted from a single-pass iterator."""
+    result = _format_job_openings_response(r for r in SAMPLE_JOB_RESULTS.results)
 
-    # Check that job IDs from metadata are included
-    assert "12345" in result
-    assert "67890" in result
+    assert result.startswith("Found 2 job opening(s):")
+    assert "Software Engineer - Remote position" in result
+    assert "Senior Data Scientist role" in result
+
+
+def test_format_job_openings_response_includes_source_location():
+    """Test that S3, web and missing source locations are formatted."""
+    results = [
+        JobOpeningResult(
+            content="S3 job",
+            source=SourceMetadata(
+                type="S3", s3_location=S3Location(uri="s3://bucket/jobs/1.json")
+            ),
+        ),
+        JobOpeningResult(
+            content="Web job",
+            source=SourceMetadata(
+                type="WEB", web_location=WebLocation(url="https://example.com/job")
+            ),
+        ),
+        JobOpeningResult(
+            content="Unknown job",
+            source=SourceMetadata(type="S3", s3_location=S3Location()),
+        ),
+    ]
+
+    result = _format_job_openings_response(results)
+
+    assert "Location: s3://bucket/jobs/1.json" in result
+    assert "URL: https://example.com/job" in result
+    assert "Location: N/A" in result
 
 
 def test_server_initialization(mock_env_vars):
     """Test that MCP server initializes correctly."""
-    from src.server import mcp
-
     assert mcp is not None
     assert mcp.name == "talent8-bedrock"
+
+
+@pytest.mark.parametrize(
+    "name, level",
+    [("INFO", logging.INFO), ("debug", logging.DEBUG), ("Warning", logging.WARNING)],
+)
+def test_resolve_log_level(name, level):
+    """Test that TALENT8_LOG level names resolve case-insensitively."""
+    assert _resolve_log_level(name) == level
+
+
+def test_resolve_log_level_falls_back_to_info(caplog):
+    """Test that an unknown TALENT8_LOG value falls back to INFO with a warning."""
+    with caplog.at_level("WARNING", logger="talent8.server"):
+        assert _resolve_log_level("bogus") == logging.INFO
+
+    assert "Invalid TALENT8_LOG level 'bogus', using INFO" in caplog.text